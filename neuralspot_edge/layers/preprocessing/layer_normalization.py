@@ -24,9 +24,19 @@ class LayerNormalization1D(BaseAugmentation1D):
 
         samples = inputs[self.SAMPLES]
 
-        mean = keras.ops.mean(samples, axis=self.data_axis, keepdims=True)
-        variance = keras.ops.var(samples, axis=self.data_axis, keepdims=True)
-        outputs = (samples - mean) / keras.ops.sqrt(variance + self.epsilon)
+        # Single fused pass: Var[X] = E[X^2] - E[X]^2 computed on mean-shifted
+        # data. Shifting by the first element keeps the two terms comparable so
+        # large DC offsets (e.g. raw ADC counts) don't catastrophically cancel
+        n = samples.shape[self.data_axis]
+        if n is None:
+            n = keras.ops.shape(samples)[self.data_axis]
+        n = keras.ops.cast(n, samples.dtype)
+        shifted = samples - keras.ops.take(samples, [0], axis=self.data_axis)
+        sum_x = keras.ops.sum(shifted, axis=self.data_axis, keepdims=True)
+        sum_x2 = keras.ops.sum(shifted * shifted, axis=self.data_axis, keepdims=True)
+        mean = sum_x / n
+        variance = keras.ops.maximum(sum_x2 / n - mean * mean, 0.0)
+        outputs = (shifted - mean) * keras.ops.rsqrt(variance + self.epsilon)
 
         return outputs  # (batch, duration, channels)
 
@@ -52,8 +62,24 @@ class LayerNormalization2D(BaseAugmentation2D):
 
         samples = inputs[self.SAMPLES]
         axis = (self.height_axis, self.width_axis)
-        mean = keras.ops.mean(samples, axis=axis, keepdims=True)
-        variance = keras.ops.var(samples, axis=axis, keepdims=True)
-        outputs = (samples - mean) / keras.ops.sqrt(variance + self.epsilon)
+
+        # Single fused pass: Var[X] = E[X^2] - E[X]^2 computed on mean-shifted
+        # data. Shifting by the first element keeps the two terms comparable so
+        # large DC offsets (e.g. raw ADC counts) don't catastrophically cancel
+        n = 1
+        for a in axis:
+            dim = samples.shape[a]
+            if dim is None:
+                dim = keras.ops.shape(samples)[a]
+            n = n * dim
+        # END FOR
+        n = keras.ops.cast(n, samples.dtype)
+        shift = keras.ops.take(keras.ops.take(samples, [0], axis=self.height_axis), [0], axis=self.width_axis)
+        shifted = samples - shift
+        sum_x = keras.ops.sum(shifted, axis=axis, keepdims=True)
+        sum_x2 = keras.ops.sum(shifted * shifted, axis=axis, keepdims=True)
+        mean = sum_x / n
+        variance = keras.ops.maximum(sum_x2 / n - mean * mean, 0.0)
+        outputs = (shifted - mean) * keras.ops.rsqrt(variance + self.epsilon)
 
         return outputs  # (batch, duration, channels)
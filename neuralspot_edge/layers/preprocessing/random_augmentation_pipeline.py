@@ -38,11 +38,20 @@ class RandomAugmentation1DPipeline(BaseAugmentation1D):
         self.force_training = force_training
         if not self.layers:
             raise ValueError("At least one layer must be provided.")
+        # When rate is constantly 1 (or 0), skip the RNG draw and cond branching entirely
+        if rate >= 1.0:
+            self._apply = self._random_choice.batch_augment
+        elif rate <= 0.0:
+            self._apply = lambda inputs: inputs
+        else:
+            self._apply = self.apply_random_choice
+        # END IF
 
-    def apply_random_choice(self, inputs):
-        skip_augment = keras.random.uniform(
-            shape=(), minval=0.0, maxval=1.0, dtype="float32", seed=self.random_generator
-        )
+    def apply_random_choice(self, inputs, skip_augment=None):
+        if skip_augment is None:
+            skip_augment = keras.random.uniform(
+                shape=(), minval=0.0, maxval=1.0, dtype="float32", seed=self.random_generator
+            )
         return keras.ops.cond(
             skip_augment > self.rate,
             lambda: inputs,
@@ -51,16 +60,59 @@ class RandomAugmentation1DPipeline(BaseAugmentation1D):
 
     def batch_augment(self, inputs):
         """Apply N random augmentations to each"""
+        # For small static counts, unroll the loop to avoid while_loop state-carry
+        # overhead and draw all uniform samples in one RNG call
+        if isinstance(self.augmentations_per_sample, int) and self.augmentations_per_sample <= 4:
+            if 0.0 < self.rate < 1.0:
+                skip_augments = keras.random.uniform(
+                    shape=(self.augmentations_per_sample,),
+                    minval=0.0,
+                    maxval=1.0,
+                    dtype="float32",
+                    seed=self.random_generator,
+                )
+                for i in range(self.augmentations_per_sample):
+                    inputs = self.apply_random_choice(inputs, skip_augment=skip_augments[i])
+                # END FOR
+            else:
+                for _ in range(self.augmentations_per_sample):
+                    inputs = self._apply(inputs)
+                # END FOR
+            # END IF
+            return inputs
+        # END IF
         return keras.ops.fori_loop(
             lower=0,
             upper=self.augmentations_per_sample,
-            body_fun=lambda _, x: self.apply_random_choice(x),
+            body_fun=lambda _, x: self._apply(x),
             init_val=inputs,
         )
 
     def call(self, inputs, training: bool = True, **kwargs):
         self._random_choice.training = training or self.force_training
-        super().call(inputs, training=training or self.force_training, **kwargs)
+        return super().call(inputs, training=training or self.force_training, **kwargs)
+
+    def as_dataset_map(self):
+        """Build a map function to run this pipeline inside a tf.data input pipeline.
+
+        Augmentation then executes on CPU worker threads overlapped with the
+        accelerator's training step instead of serializing with it:
+
+        ```python
+        ds = ds.map(pipeline.as_dataset_map(), num_parallel_calls=tf.data.AUTOTUNE).prefetch(tf.data.AUTOTUNE)
+        ```
+
+        Returns:
+            Callable: Map function taking (samples) or (samples, labels)
+        """
+
+        def _map(x, y=None):
+            samples = self(x, training=True)
+            if y is None:
+                return samples
+            return samples, y
+
+        return _map
 
     def get_config(self):
         """Serializes the configuration of the layer."""
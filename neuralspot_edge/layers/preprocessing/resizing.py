@@ -1,4 +1,5 @@
 import keras
+import numpy as np
 from .base_augmentation import BaseAugmentation1D
 from ...utils import nse_export
 
@@ -11,23 +12,67 @@ class Resizing1D(BaseAugmentation1D):
     def __init__(self, duration: int, **kwargs):
         super().__init__(**kwargs)
         self.duration = duration
+        # Interpolation weight matrices cached per input length. Kept as NumPy
+        # arrays so the cache is graph-agnostic; converting per call avoids
+        # capturing a tensor scoped to one tf.function/tf.data graph
+        self._weights: dict[int, np.ndarray] = {}
+
+    def _resize_weights(self, in_len: int) -> np.ndarray:
+        """Precompute bicubic (Catmull-Rom, 4-tap) interpolation weights.
+
+        Args:
+            in_len (int): Input duration.
+
+        Returns:
+            np.ndarray: Weight matrix of shape (duration, in_len).
+        """
+        weights = self._weights.get(in_len)
+        if weights is None:
+            a = -0.5
+            scale = in_len / self.duration
+            dst = np.arange(self.duration)
+            src = (dst + 0.5) * scale - 0.5
+            base = np.floor(src).astype(np.int64)
+            frac = src - base
+            w = np.zeros((self.duration, in_len), dtype=np.float32)
+            for tap in range(-1, 3):
+                d = np.abs(frac - tap)
+                coeff = np.where(
+                    d <= 1,
+                    ((a + 2) * d - (a + 3)) * d * d + 1,
+                    np.where(d < 2, ((a * d - 5 * a) * d + 8 * a) * d - 4 * a, 0.0),
+                )
+                idx = np.clip(base + tap, 0, in_len - 1)
+                np.add.at(w, (dst, idx), coeff)
+            # END FOR
+            weights = w
+            self._weights[in_len] = weights
+        # END IF
+        return weights
 
     def augment_samples(self, inputs) -> keras.KerasTensor:
         """Resize a batch of samples during training."""
         samples = inputs[self.SAMPLES]
 
-        # Add height dimension
-        samples = keras.ops.expand_dims(samples, axis=1)
-        samples = keras.ops.image.resize(
-            samples,
-            size=(1, self.duration),
-            interpolation="bicubic",
-            crop_to_aspect_ratio=False,
-            data_format=self.data_format,
-        )
-        # Remove height dimension
-        samples = keras.ops.squeeze(samples, axis=1)
-        return samples
+        in_len = samples.shape[self.data_axis]
+        if in_len is None:
+            # Dynamic duration: fall back to 2-D image resize on a height-1 image
+            samples = keras.ops.expand_dims(samples, axis=1)
+            samples = keras.ops.image.resize(
+                samples,
+                size=(1, self.duration),
+                interpolation="bicubic",
+                crop_to_aspect_ratio=False,
+                data_format=self.data_format,
+            )
+            return keras.ops.squeeze(samples, axis=1)
+        # END IF
+
+        # Static duration: resample via a single GEMM against precomputed weights
+        weights = keras.ops.convert_to_tensor(self._resize_weights(in_len))
+        if self.data_format == "channels_first":
+            return keras.ops.einsum("dt,bct->bcd", weights, samples)
+        return keras.ops.einsum("dt,btc->bdc", weights, samples)
 
     def compute_output_shape(self, input_shape, *args, **kwargs):
         """Compute output shape."""
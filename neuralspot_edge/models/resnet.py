@@ -1,10 +1,15 @@
 """ResNet"""
 
+from dataclasses import dataclass
+from functools import lru_cache
+
 import keras
+import numpy as np
 from pydantic import BaseModel, Field
 
 from .blocks import batch_norm, conv2d
 from .activations import relu6
+from .utils import fuse_conv_bn
 
 
 class ResNetBlockParams(BaseModel):
@@ -17,6 +22,25 @@ class ResNetBlockParams(BaseModel):
     bottleneck: bool = Field(default=False, description="Use bottleneck blocks")
 
 
+@dataclass(frozen=True)
+class ResNetBlocksSoA:
+    """Structure-of-arrays view over a list of ResNetBlockParams.
+
+    Scalar numeric fields are packed into NumPy arrays and the rest into
+    plain lists so the build loop indexes cheap contiguous storage instead
+    of invoking a Pydantic descriptor per attribute per block.
+    """
+
+    filters: np.ndarray
+    depth: np.ndarray
+    kernel_size: list[int | tuple[int, int]]
+    strides: list[int | tuple[int, int]]
+    bottleneck: list[bool]
+
+    def __len__(self) -> int:
+        return len(self.filters)
+
+
 class ResNetParams(BaseModel):
     """ResNet parameters"""
 
@@ -29,6 +53,37 @@ class ResNetParams(BaseModel):
     dropout: float = Field(default=0.2, description="Dropout rate")
     name: str = Field(default="ResNet", description="Model name")
 
+    def to_soa(self) -> ResNetBlocksSoA:
+        """Convert `blocks` to structure-of-arrays form for traversal.
+
+        Returns:
+            ResNetBlocksSoA: SoA view of the block parameters
+        """
+        blocks = self.blocks
+        return ResNetBlocksSoA(
+            filters=np.array([b.filters for b in blocks], dtype=np.int32),
+            depth=np.array([b.depth for b in blocks], dtype=np.int32),
+            kernel_size=[b.kernel_size for b in blocks],
+            strides=[b.strides for b in blocks],
+            bottleneck=[b.bottleneck for b in blocks],
+        )
+
+
+@lru_cache(maxsize=None)
+def _residual_block_config(strides: int | tuple[int, int]) -> dict:
+    """Resolve the static spec for a residual/bottleneck block.
+
+    Memoized so the many blocks sharing identical hyperparameters reuse a
+    single spec instead of re-deriving it per block.
+
+    Args:
+        strides (int | tuple[int, int]): Stride size
+
+    Returns:
+        dict: Block spec
+    """
+    return dict(downsample=strides > 1 if isinstance(strides, int) else strides[0] > 1)
+
 
 def generate_bottleneck_block(
     filters: int,
@@ -48,9 +103,11 @@ def generate_bottleneck_block(
         keras.Layer: TF functional layer
     """
 
+    downsample = _residual_block_config(strides)["downsample"]
+
     def layer(x: keras.KerasTensor) -> keras.KerasTensor:
         num_chan = x.shape[-1]
-        projection = num_chan != filters * expansion or (strides > 1 if isinstance(strides, int) else strides[0] > 1)
+        projection = num_chan != filters * expansion or downsample
 
         bx = conv2d(filters, 1, 1)(x)
         bx = batch_norm()(bx)
@@ -89,9 +146,11 @@ def generate_residual_block(
         keras.Layer: TF functional layer
     """
 
+    downsample = _residual_block_config(strides)["downsample"]
+
     def layer(x: keras.KerasTensor) -> keras.KerasTensor:
         num_chan = x.shape[-1]
-        projection = num_chan != filters or (strides > 1 if isinstance(strides, int) else strides[0] > 1)
+        projection = num_chan != filters or downsample
         bx = conv2d(filters, kernel_size, strides)(x)
         bx = batch_norm()(bx)
         bx = relu6()(bx)
@@ -140,13 +199,17 @@ def ResNet(
         y = relu6()(y)
     # END IF
 
-    for stage, block in enumerate(params.blocks):
-        for d in range(block.depth):
-            func = generate_bottleneck_block if block.bottleneck else generate_residual_block
+    # SoA view: the build loop indexes packed arrays instead of touching a
+    # Pydantic model per attribute per block
+    blocks = params.to_soa()
+    for stage in range(len(blocks)):
+        func = generate_bottleneck_block if blocks.bottleneck[stage] else generate_residual_block
+        filters = int(blocks.filters[stage])
+        for d in range(int(blocks.depth[stage])):
             y = func(
-                filters=block.filters,
-                kernel_size=block.kernel_size,
-                strides=block.strides if d == 0 and stage > 0 else 1,
+                filters=filters,
+                kernel_size=blocks.kernel_size[stage],
+                strides=blocks.strides[stage] if d == 0 and stage > 0 else 1,
             )(y)
         # END FOR
     # END FOR
@@ -167,6 +230,18 @@ def ResNet(
     return model
 
 
+def fuse_for_inference(model: keras.Model) -> keras.Model:
+    """Fold BatchNormalization layers into preceding Conv2D layers for inference.
+
+    Args:
+        model (keras.Model): Trained model
+
+    Returns:
+        keras.Model: Model with conv+BN chains fused
+    """
+    return fuse_conv_bn(model)
+
+
 def resnet_from_object(
     x: keras.KerasTensor,
     params: dict,
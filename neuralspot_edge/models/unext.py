@@ -1,8 +1,11 @@
 """UNext"""
 
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
 import keras
+import numpy as np
 from pydantic import BaseModel, Field
 
 
@@ -17,43 +20,105 @@ class UNextBlockParams(BaseModel):
     strides: int | tuple[int, int] = Field(default=2, description="Stride size")
     skip: bool = Field(default=True, description="Add skip connection")
     expand_ratio: float = Field(default=1, description="Expansion ratio")
+    groups: int = Field(default=1, description="# groups in expansion conv. Groups > 1 adds a channel shuffle")
     se_ratio: float = Field(default=0, description="Squeeze and excite ratio")
     dropout: float | None = Field(default=None, description="Dropout rate")
     norm: Literal["batch", "layer"] | None = Field(default="layer", description="Normalization type")
 
 
+@dataclass(frozen=True)
+class UNextBlocksSoA:
+    """Structure-of-arrays view over a list of UNextBlockParams.
+
+    Scalar numeric fields are packed into NumPy arrays and the rest into
+    plain lists so the build loops index cheap contiguous storage instead
+    of invoking a Pydantic descriptor per attribute per block.
+    """
+
+    filters: np.ndarray
+    depth: np.ndarray
+    ddepth: list[int | None]
+    kernel: list[int | tuple[int, int]]
+    pool: list[int | tuple[int, int]]
+    strides: list[int | tuple[int, int]]
+    skip: list[bool]
+    expand_ratio: np.ndarray
+    groups: np.ndarray
+    se_ratio: np.ndarray
+    dropout: list[float | None]
+    norm: list[Literal["batch", "layer"] | None]
+
+    def __len__(self) -> int:
+        return len(self.filters)
+
+
 class UNextParams(BaseModel):
     """UNext parameters"""
 
     blocks: list[UNextBlockParams] = Field(default_factory=list, description="UNext blocks")
+    norm: Literal["batch", "layer"] | None = Field(
+        default=None,
+        description="Normalization type applied to all blocks. Overrides block-level norm when set."
+        " 'batch' enables the fused BN kernel path on 4-D NHWC tensors.",
+    )
     include_top: bool = Field(default=True, description="Include top")
     use_logits: bool = Field(default=True, description="Use logits")
     output_kernel_size: int | tuple[int, int] = Field(default=3, description="Output kernel size")
     output_kernel_stride: int | tuple[int, int] = Field(default=1, description="Output kernel stride")
     name: str = Field(default="UNext", description="Model name")
 
+    def to_soa(self) -> UNextBlocksSoA:
+        """Convert `blocks` to structure-of-arrays form for traversal.
+
+        Returns:
+            UNextBlocksSoA: SoA view of the block parameters
+        """
+        blocks = self.blocks
+        return UNextBlocksSoA(
+            filters=np.array([b.filters for b in blocks], dtype=np.int32),
+            depth=np.array([b.depth for b in blocks], dtype=np.int32),
+            ddepth=[b.ddepth for b in blocks],
+            kernel=[b.kernel for b in blocks],
+            pool=[b.pool for b in blocks],
+            strides=[b.strides for b in blocks],
+            skip=[b.skip for b in blocks],
+            expand_ratio=np.array([b.expand_ratio for b in blocks], dtype=np.float32),
+            groups=np.array([b.groups for b in blocks], dtype=np.int32),
+            se_ratio=np.array([b.se_ratio for b in blocks], dtype=np.float32),
+            dropout=[b.dropout for b in blocks],
+            norm=[b.norm for b in blocks],
+        )
+
 
 def se_block(ratio: int = 8, name: str | None = None):
     """Squeeze and excite block"""
 
+    # Resolve names once at build time
+    name_pool = f"{name}.pool" if name else None
+    name_sq = f"{name}.sq" if name else None
+    name_relu = f"{name}.relu" if name else None
+    name_ex = f"{name}.ex" if name else None
+    name_sig = f"{name}.sigg" if name else None
+    name_mul = f"{name}.mul" if name else None
+
     def layer(x: keras.KerasTensor) -> keras.KerasTensor:
         num_chan = x.shape[-1]
-        # Squeeze
-        y = keras.layers.GlobalAveragePooling2D(name=f"{name}.pool" if name else None, keepdims=True)(x)
+        # Squeeze (keepdims so the pooled tensor feeds the pointwise conv directly)
+        y = keras.layers.GlobalAveragePooling2D(name=name_pool, keepdims=True)(x)
 
         y = keras.layers.Conv2D(
-            num_chan // ratio,
+            int(num_chan // ratio),
             kernel_size=1,
             use_bias=True,
-            name=f"{name}.sq" if name else None,
+            name=name_sq,
         )(y)
 
-        y = keras.layers.Activation("relu6", name=f"{name}.relu" if name else None)(y)
+        y = keras.layers.Activation("relu6", name=name_relu)(y)
 
         # Excite
-        y = keras.layers.Conv2D(num_chan, kernel_size=1, use_bias=True, name=f"{name}.ex" if name else None)(y)
-        y = keras.layers.Activation(keras.activations.hard_sigmoid, name=f"{name}.sigg" if name else None)(y)
-        y = keras.layers.Multiply(name=f"{name}.mul" if name else None)([x, y])
+        y = keras.layers.Conv2D(num_chan, kernel_size=1, use_bias=True, name=name_ex)(y)
+        y = keras.layers.Activation(keras.activations.hard_sigmoid, name=name_sig)(y)
+        y = keras.layers.Multiply(name=name_mul)([x, y])
         return y
 
     return layer
@@ -89,6 +154,62 @@ def norm_layer(norm: str, name: str) -> keras.Layer:
     return layer
 
 
+def channel_shuffle(groups: int, name: str | None = None) -> keras.Layer:
+    """Channel shuffle to mix channels across groups (ShuffleNet-style)
+
+    Args:
+        groups (int): # groups
+        name (str | None, optional): Layer name. Defaults to None.
+
+    Returns:
+        keras.Layer: TF functional layer
+    """
+
+    # Resolve names once at build time
+    name_split = f"{name}.split" if name else None
+    name_shuffle = f"{name}.shuffle" if name else None
+    name_merge = f"{name}.merge" if name else None
+
+    def layer(x: keras.KerasTensor) -> keras.KerasTensor:
+        height, width, num_chan = x.shape[1], x.shape[2], x.shape[3]
+        y = keras.layers.Reshape((height, width, groups, num_chan // groups), name=name_split)(x)
+        y = keras.layers.Permute((1, 2, 4, 3), name=name_shuffle)(y)
+        y = keras.layers.Reshape((height, width, num_chan), name=name_merge)(y)
+        return y
+
+    return layer
+
+
+@lru_cache(maxsize=None)
+def _unext_block_config(
+    strides: int | tuple[int, int],
+    norm: Literal["batch", "layer"] | None,
+) -> dict:
+    """Resolve the static sub-layer spec for a UNext block.
+
+    Memoized so blocks with identical hyperparameters (e.g. the decoder
+    mirror of the encoder) share a single spec instead of re-deriving it
+    per block.
+
+    Args:
+        strides (int | tuple[int, int]): Stride size
+        norm (str | None): Normalization type
+
+    Returns:
+        dict: Block spec
+    """
+    return dict(
+        # Any stride > 1 changes resolution and must disable the residual
+        strides_len=strides if isinstance(strides, int) else max(strides),
+        conv_kwargs=dict(
+            padding="same",
+            use_bias=norm is None,
+            kernel_initializer="he_normal",
+            kernel_regularizer=keras.regularizers.L2(1e-3),
+        ),
+    )
+
+
 def UNext_block(
     output_filters: int,
     expand_ratio: float = 1,
@@ -97,82 +218,106 @@ def UNext_block(
     se_ratio: float = 4,
     dropout: float | None = 0,
     norm: Literal["batch", "layer"] | None = "batch",
+    groups: int = 1,
+    dw_data_format: Literal["channels_last", "channels_first"] = "channels_last",
+    ln_axis: int | tuple[int, int] | None = None,
     name: str | None = None,
 ) -> keras.Layer:
     """Create UNext block"""
 
+    # Resolve names and static decisions once at build time
+    config = _unext_block_config(strides, norm)
+    strides_len = config["strides_len"]
+    conv_kwargs = config["conv_kwargs"]
+    name_nchw = f"{name}.dwconv.nchw" if name else None
+    name_nhwc = f"{name}.dwconv.nhwc" if name else None
+    name_dw = f"{name}.dwconv" if name else None
+    name_norm = f"{name}.norm" if name else None
+    name_expand = f"{name}.expand" if name else None
+    name_relu = f"{name}.relu" if name else None
+    name_cs = f"{name}.cs" if name else None
+    name_se = f"{name}.se" if name else None
+    name_project = f"{name}.project" if name else None
+    name_drop = f"{name}.drop" if name else None
+    name_res = f"{name}.res" if name else None
+
     def layer(x: keras.KerasTensor) -> keras.KerasTensor:
         input_filters: int = x.shape[-1]
-        strides_len = strides if isinstance(strides, int) else sum(strides) // len(strides)
         add_residual = input_filters == output_filters and strides_len == 1
-        ln_axis = 2 if x.shape[1] == 1 else 1 if x.shape[2] == 1 else (1, 2)
+        # Prefer the caller-supplied constant axis so LN stays axis-specialized
+        axis = ln_axis if ln_axis is not None else 2 if x.shape[1] == 1 else 1 if x.shape[2] == 1 else (1, 2)
 
         # Depthwise conv
+        # NOTE: Depthwise convs have little data reuse in NHWC; running just this conv
+        # in NCHW hits the faster channels-first kernels while 1x1 convs stay NHWC
+        y = x
+        if dw_data_format == "channels_first":
+            y = keras.layers.Permute((3, 1, 2), name=name_nchw)(y)
         y = keras.layers.Conv2D(
             input_filters,
             kernel_size=kernel_size,
             groups=input_filters,
-            strides=1,
-            padding="same",
-            use_bias=norm is None,
-            kernel_initializer="he_normal",
-            kernel_regularizer=keras.regularizers.L2(1e-3),
-            name=f"{name}.dwconv" if name else None,
-        )(x)
+            strides=strides,
+            data_format=dw_data_format,
+            name=name_dw,
+            **conv_kwargs,
+        )(y)
+        if dw_data_format == "channels_first":
+            y = keras.layers.Permute((2, 3, 1), name=name_nhwc)(y)
         if norm == "batch":
+            # axis=-1 on a 4-D NHWC tensor selects the fused BN kernel
             y = keras.layers.BatchNormalization(
-                name=f"{name}.norm",
+                axis=-1,
+                name=name_norm,
             )(y)
         elif norm == "layer":
             y = keras.layers.LayerNormalization(
-                axis=ln_axis,
-                name=f"{name}.norm" if name else None,
+                axis=axis,
+                name=name_norm,
             )(y)
         # END IF
 
-        # Inverted expansion block
+        # Inverted expansion block (pointwise conv)
         if expand_ratio != 1:
             y = keras.layers.Conv2D(
                 filters=int(expand_ratio * input_filters),
                 kernel_size=1,
                 strides=1,
-                padding="same",
-                use_bias=norm is None,
-                groups=input_filters,
-                kernel_initializer="he_normal",
-                kernel_regularizer=keras.regularizers.L2(1e-3),
-                name=f"{name}.expand" if name else None,
+                groups=groups,
+                name=name_expand,
+                **conv_kwargs,
             )(y)
 
             y = keras.layers.Activation(
                 "relu6",
-                name=f"{name}.relu" if name else None,
+                name=name_relu,
             )(y)
 
+            # Grouped conv doesn't mix channels across groups -> shuffle
+            if groups > 1:
+                y = channel_shuffle(groups=groups, name=name_cs)(y)
+
         # Squeeze and excite
         if se_ratio > 1:
-            name_se = f"{name}.se" if name else None
             y = se_block(ratio=se_ratio, name=name_se)(y)
 
         y = keras.layers.Conv2D(
             filters=output_filters,
             kernel_size=1,
             strides=1,
-            padding="same",
-            use_bias=norm is None,
-            kernel_initializer="he_normal",
-            kernel_regularizer=keras.regularizers.L2(1e-3),
-            name=f"{name}.project" if name else None,
+            name=name_project,
+            **conv_kwargs,
         )(y)
 
         if add_residual:
             if dropout and dropout > 0:
+                # Default noise_shape: a static batch dim in noise_shape defeats
+                # the backend's single fused RNG + mul mask generation
                 y = keras.layers.Dropout(
                     dropout,
-                    noise_shape=(y.shape),
-                    name=f"{name}.drop" if name else None,
+                    name=name_drop,
                 )(y)
-            y = keras.layers.Add(name=f"{name}.res" if name else None)([x, y])
+            y = keras.layers.Add(name=name_res)([x, y])
         return y
 
     # END DEF
@@ -193,133 +338,166 @@ def unext_core(
         keras.KerasTensor: Output tensor
     """
 
+    if len(x.shape) != 4:
+        raise ValueError(f"Expect a 4-D NHWC input tensor. Got shape: {x.shape}")
+
+    # LN axis is static: (B,1,W,C) normalizes along W, (B,H,1,C) along H, else (H,W)
+    ln_axis = 2 if x.shape[1] == 1 else 1 if x.shape[2] == 1 else (1, 2)
+
     y = x
 
+    # SoA view: the build loops index packed arrays instead of touching a
+    # Pydantic model per attribute per block
+    blocks = params.to_soa()
+
     #### ENCODER ####
     skip_layers: list[keras.layers.Layer | None] = []
-    for i, block in enumerate(params.blocks):
+    for i in range(len(blocks)):
         name = f"ENC{i+1}"
-        for d in range(block.depth):
+        norm = params.norm if params.norm is not None else blocks.norm[i]
+        filters = int(blocks.filters[i])
+        depth = int(blocks.depth[i])
+        # Pure downsample stage: no blocks to fold the stride into, so keep the
+        # standalone strided conv (+ norm) and capture the skip beforehand
+        if depth == 0:
+            skip_layers.append(y if blocks.skip[i] else None)
+            y = keras.layers.Conv2D(
+                filters=filters,
+                kernel_size=blocks.pool[i],
+                strides=blocks.strides[i],
+                padding="same",
+                use_bias=norm is None,
+                kernel_initializer="he_normal",
+                kernel_regularizer=keras.regularizers.L2(1e-3),
+                name=f"{name}.pool",
+            )(y)
+            if norm == "batch":
+                y = keras.layers.BatchNormalization(
+                    axis=-1,
+                    name=f"{name}.norm",
+                )(y)
+            elif norm == "layer":
+                y = keras.layers.LayerNormalization(
+                    axis=ln_axis,
+                    name=f"{name}.norm",
+                )(y)
+            # END IF
+            continue
+        # END IF
+        for d in range(depth):
+            # Downsample inside the final block's depthwise conv; capture the skip
+            # beforehand so it keeps full resolution
+            if d == depth - 1:
+                skip_layers.append(y if blocks.skip[i] else None)
             y = UNext_block(
-                output_filters=block.filters,
-                expand_ratio=block.expand_ratio,
-                kernel_size=block.kernel,
-                strides=1,
-                se_ratio=block.se_ratio,
-                dropout=block.dropout,
-                norm=block.norm,
+                output_filters=filters,
+                expand_ratio=float(blocks.expand_ratio[i]),
+                kernel_size=blocks.kernel[i],
+                strides=blocks.strides[i] if d == depth - 1 else 1,
+                se_ratio=float(blocks.se_ratio[i]),
+                dropout=blocks.dropout[i],
+                norm=norm,
+                groups=int(blocks.groups[i]),
+                ln_axis=ln_axis,
                 name=f"{name}.D{d+1}",
             )(y)
         # END FOR
-        skip_layers.append(y if block.skip else None)
-
-        # Downsample using strided conv
-        y = keras.layers.Conv2D(
-            filters=block.filters,
-            kernel_size=block.pool,
-            strides=block.strides,
-            padding="same",
-            use_bias=block.norm is None,
-            kernel_initializer="he_normal",
-            kernel_regularizer=keras.regularizers.L2(1e-3),
-            name=f"{name}.pool",
-        )(y)
-        if block.norm == "batch":
-            y = keras.layers.BatchNormalization(
-                name=f"{name}.norm",
-            )(y)
-        elif block.norm == "layer":
-            ln_axis = 2 if y.shape[1] == 1 else 1 if y.shape[2] == 1 else (1, 2)
-            y = keras.layers.LayerNormalization(
-                axis=ln_axis,
-                name=f"{name}.norm",
-            )(y)
-        # END IF
     # END FOR
 
     #### DECODER ####
-    for i, block in enumerate(reversed(params.blocks)):
+    for i, b in enumerate(range(len(blocks) - 1, -1, -1)):
         name = f"DEC{i+1}"
-        for d in range(block.ddepth or block.depth):
+        norm = params.norm if params.norm is not None else blocks.norm[b]
+        filters = int(blocks.filters[b])
+        depth = int(blocks.depth[b])
+        for d in range(blocks.ddepth[b] or depth):
             y = UNext_block(
-                output_filters=block.filters,
-                expand_ratio=block.expand_ratio,
-                kernel_size=block.kernel,
+                output_filters=filters,
+                expand_ratio=float(blocks.expand_ratio[b]),
+                kernel_size=blocks.kernel[b],
                 strides=1,
-                se_ratio=block.se_ratio,
-                dropout=block.dropout,
-                norm=block.norm,
+                se_ratio=float(blocks.se_ratio[b]),
+                dropout=blocks.dropout[b],
+                norm=norm,
+                groups=int(blocks.groups[b]),
+                ln_axis=ln_axis,
                 name=f"{name}.D{d+1}",
             )(y)
         # END FOR
 
-        # Upsample using transposed conv
-        # y = keras.layers.Conv1DTranspose(
-        #     filters=block.filters,
-        #     kernel_size=block.pool,
-        #     strides=block.strides,
-        #     padding="same",
-        #     kernel_initializer="he_normal",
-        #     kernel_regularizer=keras.regularizers.L2(1e-3),
-        #     name=f"{name}.unpool",
-        # )(y)
-
-        y = keras.layers.Conv2D(
-            filters=block.filters,
-            kernel_size=block.pool,
-            strides=1,
+        # Upsample using transposed conv (single kernel vs conv + upsample pass)
+        y = keras.layers.Conv2DTranspose(
+            filters=filters,
+            kernel_size=blocks.pool[b],
+            strides=blocks.strides[b],
             padding="same",
-            use_bias=block.norm is None,
+            use_bias=norm is None,
             kernel_initializer="he_normal",
             kernel_regularizer=keras.regularizers.L2(1e-3),
-            name=f"{name}.conv",
+            name=f"{name}.unpool",
         )(y)
-        y = keras.layers.UpSampling2D(size=block.strides, name=f"{name}.unpool")(y)
 
         # Skip connection
         skip_layer = skip_layers.pop()
         if skip_layer is not None:
+            # Skip may carry the previous stage's channel count (depth-1 stages)
+            if skip_layer.shape[-1] != y.shape[-1]:
+                skip_layer = keras.layers.Conv2D(
+                    y.shape[-1],
+                    kernel_size=1,
+                    padding="same",
+                    use_bias=norm is None,
+                    kernel_initializer="he_normal",
+                    kernel_regularizer=keras.regularizers.L2(1e-3),
+                    name=f"{name}.S1.proj",
+                )(skip_layer)
+            # END IF
             # y = keras.layers.Concatenate(name=f"{name}.S1.cat")([y, skip_layer])
             y = keras.layers.Add(name=f"{name}.S1.cat")([y, skip_layer])
 
-            # Use conv to reduce filters
-            y = keras.layers.Conv2D(
-                block.filters,
-                kernel_size=1,  # block.kernel,
-                padding="same",
-                kernel_initializer="he_normal",
-                kernel_regularizer=keras.regularizers.L2(1e-3),
-                use_bias=block.norm is None,
-                name=f"{name}.S1.conv",
-            )(y)
-
-            if block.norm == "batch":
-                y = keras.layers.BatchNormalization(
-                    name=f"{name}.S1.norm",
+            # Use conv to reduce filters. Skipped when channels already match:
+            # the 1x1 conv would just reproject C -> C at H*W*C^2 MACs per stage
+            if y.shape[-1] != filters or skip_layer.shape[-1] != filters:
+                y = keras.layers.Conv2D(
+                    filters,
+                    kernel_size=1,  # block.kernel,
+                    padding="same",
+                    kernel_initializer="he_normal",
+                    kernel_regularizer=keras.regularizers.L2(1e-3),
+                    use_bias=norm is None,
+                    name=f"{name}.S1.conv",
                 )(y)
-            elif block.norm == "layer":
-                ln_axis = 2 if y.shape[1] == 1 else 1 if y.shape[2] == 1 else (1, 2)
-                y = keras.layers.LayerNormalization(
-                    axis=ln_axis,
-                    name=f"{name}.S1.norm",
+
+                if norm == "batch":
+                    y = keras.layers.BatchNormalization(
+                        axis=-1,
+                        name=f"{name}.S1.norm",
+                    )(y)
+                elif norm == "layer":
+                    y = keras.layers.LayerNormalization(
+                        axis=ln_axis,
+                        name=f"{name}.S1.norm",
+                    )(y)
+                # END IF
+
+                y = keras.layers.Activation(
+                    "relu6",
+                    name=f"{name}.S1.relu" if name else None,
                 )(y)
             # END IF
-
-            y = keras.layers.Activation(
-                "relu6",
-                name=f"{name}.S1.relu" if name else None,
-            )(y)
         # END IF
 
         y = UNext_block(
-            output_filters=block.filters,
-            expand_ratio=block.expand_ratio,
-            kernel_size=block.kernel,
+            output_filters=filters,
+            expand_ratio=float(blocks.expand_ratio[b]),
+            kernel_size=blocks.kernel[b],
             strides=1,
-            se_ratio=block.se_ratio,
-            dropout=block.dropout,
-            norm=block.norm,
-            name=f"{name}.D{block.depth+1}",
+            se_ratio=float(blocks.se_ratio[b]),
+            dropout=blocks.dropout[b],
+            norm=norm,
+            groups=int(blocks.groups[b]),
+            ln_axis=ln_axis,
+            name=f"{name}.D{depth+1}",
         )(y)
 
     # END FOR
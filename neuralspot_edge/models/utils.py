@@ -4,6 +4,7 @@ import itertools
 import glob
 from pathlib import Path
 import keras
+import numpy as np
 
 from ..utils import download_file
 
@@ -103,6 +104,95 @@ def load_model(model_path: os.PathLike) -> keras.Model:
     return model
 
 
+def fuse_conv_bn(model: keras.Model) -> keras.Model:
+    """Folds BatchNormalization layers into the preceding Conv2D layers for inference.
+
+    Each Conv2D -> BatchNormalization chain is replaced by a single Conv2D (use_bias=True)
+    whose kernel and bias absorb the BN affine transform:
+        w' = w * gamma / sqrt(var + eps)
+        b' = beta + (b - mean) * gamma / sqrt(var + eps)
+    This halves the layer count in conv/BN-heavy trunks and removes a full pass over
+    the activations per layer.
+
+    Args:
+        model (keras.Model): Model
+
+    Returns:
+        keras.Model: Model with BN layers folded into conv layers
+    """
+
+    # Map each conv output to its consumers to ensure BN is the sole consumer
+    consumers: dict[str, list[str]] = {}
+    for layer in model.layers:
+        for node in layer._inbound_nodes:
+            for tensor in node.input_tensors:
+                parent = tensor._keras_history.operation
+                if parent is not None:
+                    consumers.setdefault(parent.name, []).append(layer.name)
+            # END FOR
+        # END FOR
+    # END FOR
+
+    # Identify Conv2D -> BatchNormalization pairs (keyed by layer name)
+    conv_to_bn: dict[str, str] = {}
+    bn_names: set[str] = set()
+    for layer in model.layers:
+        if not isinstance(layer, keras.layers.BatchNormalization):
+            continue
+        if layer.axis not in (-1, len(model.output_shape) - 1):
+            continue
+        parent = layer._inbound_nodes[0].input_tensors[0]._keras_history.operation
+        if (
+            isinstance(parent, keras.layers.Conv2D)
+            and consumers.get(parent.name) == [layer.name]
+            # Folding BN through a non-linear conv activation is invalid
+            and parent.activation is keras.activations.linear
+        ):
+            conv_to_bn[parent.name] = layer.name
+            bn_names.add(layer.name)
+        # END IF
+    # END FOR
+
+    # Clone the graph substituting fused convs and dropping the BN layers
+    fused_convs: dict[str, keras.layers.Conv2D] = {}
+    for conv_name in conv_to_bn:
+        config = model.get_layer(conv_name).get_config()
+        config["use_bias"] = True
+        fused_convs[conv_name] = keras.layers.Conv2D.from_config(config)
+    # END FOR
+
+    def call_function(layer, *args, **kwargs):
+        if layer.name in bn_names:
+            return args[0]
+        if layer.name in fused_convs:
+            return fused_convs[layer.name](*args, **kwargs)
+        return layer(*args, **kwargs)
+
+    # END DEF
+    # Identity clone_function reuses every untouched layer instance (weights and
+    # all); only the substituted fused convs are new and need weights computed
+    model_clone = keras.models.clone_model(
+        model,
+        clone_function=lambda lyr: lyr,
+        call_function=call_function,
+    )
+
+    # Compute fused kernel/bias for each conv+BN pair
+    for conv_name, bn_name in conv_to_bn.items():
+        conv = model.get_layer(conv_name)
+        bn = model.get_layer(bn_name)
+        kernel = conv.kernel.numpy()
+        bias = conv.bias.numpy() if conv.use_bias else np.zeros(kernel.shape[-1], dtype=kernel.dtype)
+        gamma = bn.gamma.numpy() if bn.scale else np.ones(kernel.shape[-1], dtype=kernel.dtype)
+        beta = bn.beta.numpy() if bn.center else np.zeros(kernel.shape[-1], dtype=kernel.dtype)
+        mean = bn.moving_mean.numpy()
+        var = bn.moving_variance.numpy()
+        scale = gamma / np.sqrt(var + bn.epsilon)
+        fused_convs[conv_name].set_weights([kernel * scale[None, None, None, :], beta + (bias - mean) * scale])
+    # END FOR
+    return model_clone
+
+
 def append_layers(model: keras.Model, layers: list[keras.Layer], copy_weights: bool = True) -> keras.Model:
     """Appends layers to a model by cloning it and adding the layers.
 
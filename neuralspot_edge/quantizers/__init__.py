@@ -0,0 +1 @@
+from .ptq import FakeQuant, apply_int8_quantization, calibrate
@@ -0,0 +1,120 @@
+"""INT8 post-training quantization utilities"""
+
+import keras
+
+from ..utils import nse_export
+
+
+@nse_export(path="neuralspot_edge.quantizers.FakeQuant")
+class FakeQuant(keras.layers.Layer):
+    """Per-tensor symmetric INT8 quantize/dequantize op.
+
+    Args:
+        scale (float): Quantization step size (max |x| / 127)
+    """
+
+    def __init__(self, scale: float, **kwargs):
+        super().__init__(**kwargs)
+        self.scale = scale
+
+    def call(self, inputs):
+        return keras.ops.round(keras.ops.clip(inputs / self.scale, -127, 127)) * self.scale
+
+    def get_config(self):
+        """Serializes the configuration of the layer."""
+        config = super().get_config()
+        config.update({"scale": self.scale})
+        return config
+
+
+def calibrate(model: keras.Model, dataset, steps: int = 8) -> dict[str, float]:
+    """Compute per-tensor activation ranges for conv/dense layers.
+
+    Runs up to `steps` batches through the model and records the max |x| seen
+    at each Conv2D/Dense output. The resulting ranges feed
+    `apply_int8_quantization` to fake-quantize activations.
+
+    Args:
+        model (keras.Model): Model
+        dataset: Iterable of batches (or (x, y) tuples)
+        steps (int, optional): Max # batches to run. Defaults to 8.
+
+    Returns:
+        dict[str, float]: Max |activation| keyed by layer name
+    """
+    layers = [lyr for lyr in model.layers if isinstance(lyr, (keras.layers.Conv2D, keras.layers.Dense))]
+
+    # Resolve each layer's output tensor within this model's graph; layer.output
+    # is ambiguous when an instance carries nodes from several graphs (e.g. the
+    # layers reused by fuse_conv_bn)
+    outputs_by_name: dict[str, keras.KerasTensor] = {}
+    seen: set[int] = set()
+    stack = list(model.outputs)
+    while stack:
+        tensor = stack.pop()
+        if id(tensor) in seen:
+            continue
+        seen.add(id(tensor))
+        operation = tensor._keras_history.operation
+        if operation is None:
+            continue
+        outputs_by_name.setdefault(operation.name, tensor)
+        stack.extend(operation._inbound_nodes[tensor._keras_history.node_index].input_tensors)
+    # END WHILE
+
+    layers = [lyr for lyr in layers if lyr.name in outputs_by_name]
+    probe = keras.Model(model.inputs, [outputs_by_name[lyr.name] for lyr in layers])
+    ranges = {lyr.name: 0.0 for lyr in layers}
+    for step, batch in enumerate(dataset):
+        if step >= steps:
+            break
+        x = batch[0] if isinstance(batch, (tuple, list)) else batch
+        outputs = probe(x, training=False)
+        for lyr, out in zip(layers, outputs):
+            ranges[lyr.name] = max(ranges[lyr.name], float(keras.ops.max(keras.ops.abs(out))))
+        # END FOR
+    # END FOR
+    return ranges
+
+
+def apply_int8_quantization(model: keras.Model, ranges: dict[str, float] | None = None) -> keras.Model:
+    """Simulate INT8 post-training quantization of a model.
+
+    Clones the model with each Conv2D/Dense kernel fake-quantized to int8
+    per output channel (abs-max symmetric). When activation `ranges` from
+    `calibrate` are provided, a per-tensor quantize/dequantize op is inserted
+    after each calibrated layer so the model's accuracy under an INT8
+    deployment (e.g. TFLite) can be evaluated in Keras.
+
+    Args:
+        model (keras.Model): Model
+        ranges (dict[str, float] | None, optional): Activation ranges from `calibrate`. Defaults to None.
+
+    Returns:
+        keras.Model: Fake-quantized model
+    """
+
+    def call_function(layer, *args, **kwargs):
+        out = layer(*args, **kwargs)
+        if ranges and ranges.get(layer.name, 0) > 0:
+            out = FakeQuant(ranges[layer.name] / 127.0, name=f"{layer.name}.fq")(out)
+        return out
+
+    # END DEF
+    model_clone = keras.models.clone_model(model, call_function=call_function)
+    for layer in model_clone.layers:
+        if layer.weights:
+            layer.set_weights(model.get_layer(layer.name).get_weights())
+        # END IF
+    # END FOR
+
+    # Fake-quantize kernels per output channel (abs-max symmetric int8)
+    for layer in model_clone.layers:
+        if isinstance(layer, (keras.layers.Conv2D, keras.layers.Dense)):
+            kernel = layer.kernel
+            axis = tuple(range(len(kernel.shape) - 1))
+            quantized, scale = keras.quantizers.abs_max_quantize(kernel, axis=axis)
+            layer.kernel.assign(keras.ops.cast(quantized, kernel.dtype) / scale)
+        # END IF
+    # END FOR
+    return model_clone
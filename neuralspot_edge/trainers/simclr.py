@@ -25,10 +25,12 @@ class SimCLRTrainer(ContrastiveTrainer):
         """
         if projector is None:
             projection_width = encoder.output_shape[-1]
+            # Bias-less second Dense: the trailing BN is then a pure affine on the
+            # matmul output and folds into it at inference (see fuse_projector)
             projector = keras.Sequential(
                 [
                     keras.layers.Dense(projection_width, activation="relu"),
-                    keras.layers.Dense(projection_width),
+                    keras.layers.Dense(projection_width, use_bias=False),
                     keras.layers.BatchNormalization(),
                 ],
                 name="projector",
@@ -40,6 +42,40 @@ class SimCLRTrainer(ContrastiveTrainer):
             **kwargs,
         )
 
+    def fuse_projector(self) -> keras.Model:
+        """Fold the projector's trailing BatchNormalization into the preceding Dense.
+
+        BN after a bias-less Dense is an affine transform on the matmul output, so
+        at inference `W' = W * gamma / sqrt(var + eps)` and
+        `b' = beta - mean * gamma / sqrt(var + eps)` collapse Dense+BN into a
+        single GEMM for downstream feature extraction.
+
+        Returns:
+            keras.Model: Projector with the Dense+BN pair fused
+        """
+        projector = self.projectors[0]
+        layers = projector.layers
+        if not (
+            len(layers) >= 2
+            and isinstance(layers[-1], keras.layers.BatchNormalization)
+            and isinstance(layers[-2], keras.layers.Dense)
+        ):
+            return projector
+        # END IF
+        dense, bn = layers[-2], layers[-1]
+        gamma, beta, mean, variance = (keras.ops.convert_to_numpy(w) for w in (bn.gamma, bn.beta, bn.moving_mean, bn.moving_variance))
+        scale = gamma / (variance + bn.epsilon) ** 0.5
+        kernel = keras.ops.convert_to_numpy(dense.kernel) * scale
+        bias = beta - mean * scale
+        if dense.use_bias:
+            bias = bias + keras.ops.convert_to_numpy(dense.bias) * scale
+
+        fused_dense = keras.layers.Dense(dense.units, name=f"{dense.name}.fused")
+        fused = keras.Sequential(layers[:-2] + [fused_dense], name=f"{projector.name}.fused")
+        fused.build(projector.input_shape)
+        fused_dense.set_weights([kernel, bias])
+        return fused
+
     def compile(
         self,
         encoder_optimizer: keras.Optimizer,